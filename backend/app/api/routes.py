@@ -1,29 +1,43 @@
 from __future__ import annotations
 
 import datetime as dt
+import json
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from ..database import session_scope
 from ..schemas import (
+    ActionItemResponse,
+    ActionItemSearchQuery,
+    ActionItemStatusRequest,
+    AssigneeAnalyticsResponse,
     HistoryResponse,
+    MeetingAnalyticsResponse,
     MinutesCreateRequest,
     MinutesDetailResponse,
     MinutesListResponse,
     MinutesResponse,
     MinutesSearchQuery,
+    MonthlyAnalyticsResponse,
+    RelatedMinutesResponse,
     ReminderRequest,
     ReminderResponse,
+    SummaryCacheStats,
     SummaryRequest,
     SummaryResponse,
 )
+from ..services import action_items as action_items_service
+from ..services import analytics as analytics_service
 from ..services import export as export_service
 from ..services import minutes as minutes_service
 from ..services import notifications
-from ..services.summary import summarize
+from ..services import similarity as similarity_service
+from ..services import snapshot as snapshot_service
+from ..services.preview import PreviewSession
+from ..services.summary_cache import summary_cache
 
 router = APIRouter(prefix="/api", tags=["minutes"])
 
@@ -35,16 +49,38 @@ def get_session() -> Session:
 
 @router.post("/minutes/generate", response_model=SummaryResponse)
 def generate_summary(payload: SummaryRequest) -> SummaryResponse:
-    return summarize(payload)
+    return summary_cache.summarize(payload)
 
 
-@router.post("/minutes", response_model=MinutesResponse)
+@router.get("/minutes/generate/cache-stats", response_model=SummaryCacheStats)
+def summary_cache_stats() -> SummaryCacheStats:
+    return summary_cache.stats()
+
+
+@router.websocket("/minutes/preview")
+async def preview_summary(websocket: WebSocket) -> None:
+    await websocket.accept()
+    preview = PreviewSession()
+    try:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                summary = preview.apply(json.loads(message))
+            except ValueError as exc:
+                await websocket.send_json({"error": str(exc)})
+                continue
+            await websocket.send_text(summary.json(ensure_ascii=False))
+    except WebSocketDisconnect:
+        return
+
+
+@router.post("/minutes", response_model=MinutesResponse, response_model_exclude_unset=True)
 def create_minutes(payload: MinutesCreateRequest, session: Session = Depends(get_session)) -> MinutesResponse:
     sanitized = minutes_service.enforce_limits(payload)
     return minutes_service.create_minutes(session, sanitized)
 
 
-@router.put("/minutes/{minutes_id}", response_model=MinutesResponse)
+@router.put("/minutes/{minutes_id}", response_model=MinutesResponse, response_model_exclude_unset=True)
 def update_minutes(minutes_id: int, payload: MinutesCreateRequest, session: Session = Depends(get_session)) -> MinutesResponse:
     sanitized = minutes_service.enforce_limits(payload)
     try:
@@ -65,10 +101,14 @@ def list_minutes(
     return minutes_service.list_minutes(session, query)
 
 
-@router.get("/minutes/{minutes_id}", response_model=MinutesDetailResponse)
-def get_minutes(minutes_id: int, session: Session = Depends(get_session)) -> MinutesDetailResponse:
+@router.get("/minutes/{minutes_id}", response_model=MinutesDetailResponse, response_model_exclude_unset=True)
+def get_minutes(
+    minutes_id: int,
+    include_raw_input: bool = False,
+    session: Session = Depends(get_session),
+) -> MinutesDetailResponse:
     try:
-        return minutes_service.get_minutes_detail(session, minutes_id)
+        return minutes_service.get_minutes_detail(session, minutes_id, include_raw_input)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -81,6 +121,18 @@ def get_history(minutes_id: int, session: Session = Depends(get_session)) -> Lis
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+@router.get("/minutes/{minutes_id}/related", response_model=List[RelatedMinutesResponse])
+def get_related(
+    minutes_id: int,
+    limit: int = Query(default=5, ge=1, le=50),
+    session: Session = Depends(get_session),
+) -> List[RelatedMinutesResponse]:
+    try:
+        return similarity_service.related_minutes(session, minutes_id, limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
 @router.post("/minutes/{minutes_id}/reminders", response_model=ReminderResponse)
 def create_reminder(minutes_id: int, payload: ReminderRequest, session: Session = Depends(get_session)) -> ReminderResponse:
     try:
@@ -98,8 +150,51 @@ def send_reminder(minutes_id: int, payload: ReminderRequest, session: Session =
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+@router.get("/action-items", response_model=List[ActionItemResponse])
+def list_action_items(
+    assignee: str | None = None,
+    status: str | None = None,
+    due_before: dt.date | None = Query(default=None),
+    due_after: dt.date | None = Query(default=None),
+    session: Session = Depends(get_session),
+) -> List[ActionItemResponse]:
+    query = ActionItemSearchQuery(assignee=assignee, status=status, due_before=due_before, due_after=due_after)
+    return action_items_service.list_action_items(session, query)
+
+
+@router.put("/action-items/{item_id}", response_model=ActionItemResponse)
+def update_action_item(item_id: int, payload: ActionItemStatusRequest, session: Session = Depends(get_session)) -> ActionItemResponse:
+    try:
+        return action_items_service.update_status(session, item_id, payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@router.get("/analytics/meetings-per-month", response_model=List[MonthlyAnalyticsResponse])
+def meetings_per_month(
+    start: str | None = Query(default=None, pattern=r"^\d{4}-\d{2}$"),
+    end: str | None = Query(default=None, pattern=r"^\d{4}-\d{2}$"),
+    session: Session = Depends(get_session),
+) -> List[MonthlyAnalyticsResponse]:
+    return analytics_service.meetings_per_month(session, start, end)
+
+
+@router.get("/analytics/open-action-items", response_model=List[AssigneeAnalyticsResponse])
+def open_action_items_per_assignee(
+    limit: int = Query(default=50, ge=1, le=500), session: Session = Depends(get_session)
+) -> List[AssigneeAnalyticsResponse]:
+    return analytics_service.open_action_items_per_assignee(session, limit)
+
+
+@router.get("/analytics/edits", response_model=List[MeetingAnalyticsResponse])
+def edits_per_meeting(
+    limit: int = Query(default=50, ge=1, le=500), session: Session = Depends(get_session)
+) -> List[MeetingAnalyticsResponse]:
+    return analytics_service.edits_per_meeting(session, limit)
+
+
 @router.get("/minutes/{minutes_id}/export/pdf")
-def export_pdf(minutes_id: int, session: Session = Depends(get_session)) -> StreamingResponse:
+def export_pdf(minutes_id: int, session: Session = Depends(get_session)) -> Response:
     try:
         minutes = minutes_service.get_minutes_detail(session, minutes_id)
     except ValueError as exc:
@@ -107,8 +202,8 @@ def export_pdf(minutes_id: int, session: Session = Depends(get_session)) -> Stre
 
     pdf_payload = MinutesResponse(**minutes.dict(exclude={"versions", "reminders"}))
     pdf_bytes = export_service.build_pdf(pdf_payload)
-    return StreamingResponse(
-        iter([pdf_bytes]),
+    return Response(
+        content=pdf_bytes,
         media_type="application/pdf",
         headers={"Content-Disposition": f"attachment; filename=minutes-{minutes_id}.pdf"},
     )
@@ -121,12 +216,23 @@ def export_csv(
     start_date: dt.date | None = Query(default=None),
     end_date: dt.date | None = Query(default=None),
     session: Session = Depends(get_session),
-) -> StreamingResponse:
+) -> Response:
     query = MinutesSearchQuery(title=title, participant=participant, start_date=start_date, end_date=end_date)
     rows = minutes_service.list_minutes(session, query)
     csv_content = export_service.build_csv(rows)
-    return StreamingResponse(
-        iter([csv_content.encode("utf-8")]),
+    return Response(
+        content=csv_content.encode("utf-8"),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=minutes.csv"},
     )
+
+
+@router.get("/admin/snapshot")
+def export_snapshot() -> StreamingResponse:
+    filename = f"minutes-snapshot-{dt.date.today():%Y%m%d}.ndjson.gz"
+    return StreamingResponse(
+        snapshot_service.stream_snapshot(),
+        media_type="application/x-ndjson",
+        # already gzip-compressed; the header also keeps GZipMiddleware from compressing it again
+        headers={"Content-Encoding": "gzip", "Content-Disposition": f"attachment; filename={filename}"},
+    )
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+from sqlalchemy import select
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="議事録アプリの運用コマンド")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    archive_parser = commands.add_parser("archive", help="古い議事録をアーカイブ DB へ移動する")
+    archive_parser.add_argument(
+        "--older-than-days",
+        type=int,
+        help="会議日からの経過日数がこれを超えたものを移動する（既定: 730）",
+    )
+
+    commands.add_parser("sync-action-items", help="既存の議事録から宿題テーブルを再構築する")
+    commands.add_parser("rebuild-analytics", help="集計テーブルを全データから再計算する")
+    commands.add_parser("rebuild-similarity", help="類似議事録インデックスを全データから再構築する")
+
+    snapshot_parser = commands.add_parser("snapshot", help="全データを圧縮 NDJSON のスナップショットに書き出す")
+    snapshot_parser.add_argument("output", help="出力ファイル（例: minutes.ndjson.gz）")
+
+    restore_parser = commands.add_parser("restore", help="スナップショットを空の DB に復元する")
+    restore_parser.add_argument("input", help="snapshot コマンドまたは /api/admin/snapshot で取得したファイル")
+
+    loadtest_parser = commands.add_parser("loadtest", help="実運用に近い API 呼び出しを指定レートで再生する")
+    loadtest_parser.add_argument("--base-url", help="対象サーバーの URL（省略時はプロセス内でアプリを起動）")
+    loadtest_parser.add_argument("--rate", type=float, default=20.0, help="1 秒あたりの送信リクエスト数")
+    loadtest_parser.add_argument("--duration", type=float, default=30.0, help="実行時間（秒）")
+    loadtest_parser.add_argument("--mix", help="ルートごとの重み（例: generate=30,list=20,detail=10）")
+    loadtest_parser.add_argument("--seed-minutes", type=int, default=20, help="事前に登録する議事録の件数")
+    loadtest_parser.add_argument("--concurrency", type=int, default=64, help="同時に送信中にできるリクエスト数の上限")
+    loadtest_parser.add_argument(
+        "--allow-writes", action="store_true", help="--base-url のサーバーへ議事録の登録・通知を書き込むことを許可する"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "loadtest":
+        run_loadtest(parser, args)
+        return
+
+    # imported here so an in-process load test can still choose its own database
+    from . import models
+    from .database import init_db, session_scope
+    from .services import action_items, analytics, archive, similarity, snapshot
+
+    init_db()
+
+    if args.command == "archive":
+        older_than_days = archive.ARCHIVE_AFTER_DAYS if args.older_than_days is None else args.older_than_days
+        with session_scope() as session:
+            moved = archive.archive_minutes(session, older_than_days)
+        print(f"{moved} 件の議事録をアーカイブしました")
+    elif args.command == "sync-action-items":
+        with session_scope() as session:
+            records = session.execute(select(models.Minutes)).scalars().all()
+            for minutes in records:
+                action_items.sync_action_items(session, minutes)
+        print(f"{len(records)} 件の議事録の宿題を同期しました")
+    elif args.command == "rebuild-analytics":
+        with session_scope() as session:
+            analytics.rebuild(session)
+        print("集計テーブルを再計算しました")
+    elif args.command == "rebuild-similarity":
+        with session_scope() as session:
+            count = similarity.rebuild(session)
+        print(f"{count} 件の議事録を類似検索インデックスに登録しました")
+    elif args.command == "snapshot":
+        with open(args.output, "wb") as output:
+            for chunk in snapshot.stream_snapshot():
+                output.write(chunk)
+        print(f"スナップショットを {args.output} に書き出しました")
+    elif args.command == "restore":
+        with open(args.input, "rb") as source:
+            try:
+                restored = snapshot.restore_snapshot(source, progress=_report_progress)
+            except ValueError as exc:
+                sys.exit(f"復元に失敗しました: {exc}")
+        print(f"\n{restored} 行を復元しました。集計と類似検索インデックスを再構築します")
+        with session_scope() as session:
+            analytics.rebuild(session)
+        with session_scope() as session:
+            similarity.rebuild(session)
+        print("復元が完了しました")
+
+
+def _report_progress(rows: int) -> None:
+    print(f"\r{rows} 行を復元済み", end="", file=sys.stderr, flush=True)
+
+
+def run_loadtest(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    from . import loadtest
+
+    try:
+        mix = loadtest.parse_mix(args.mix) if args.mix else None
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.base_url and not args.allow_writes:
+        parser.error("--base-url を指定する場合は --allow-writes が必要です（議事録の登録とリマインダー送信を行うため）")
+    stats, elapsed = asyncio.run(
+        loadtest.run(
+            base_url=args.base_url,
+            rate=args.rate,
+            duration=args.duration,
+            mix=mix,
+            seed_minutes=args.seed_minutes,
+            concurrency=args.concurrency,
+            allow_writes=args.allow_writes,
+        )
+    )
+    print(loadtest.format_report(stats, elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import os
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
 
-DB_PATH = Path(__file__).resolve().parent.parent / "minutes.db"
+DB_PATH = Path(os.environ.get("MINUTES_DB_PATH", Path(__file__).resolve().parent.parent / "minutes.db"))
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
+ARCHIVE_DB_PATH = DB_PATH.with_name(f"{DB_PATH.stem}_archive{DB_PATH.suffix}")
+ARCHIVE_SCHEMA = "archive"
 
 environment_engine_kwargs = {
     "connect_args": {"check_same_thread": False},
@@ -16,6 +19,21 @@ environment_engine_kwargs = {
 }
 
 engine = create_engine(SQLALCHEMY_DATABASE_URL, **environment_engine_kwargs)
+
+
+@event.listens_for(engine, "connect")
+def attach_archive(dbapi_connection, connection_record) -> None:
+    # 古い議事録は別ファイルのアーカイブ DB に置き、同じ接続から参照する
+    dbapi_connection.execute(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (str(ARCHIVE_DB_PATH),))
+
+
+@event.listens_for(engine, "connect")
+def use_wal_journal(dbapi_connection, connection_record) -> None:
+    # WAL では読み取り中も書き込みが止まらない（スナップショットの長い読み取り対策）
+    for schema in ("main", ARCHIVE_SCHEMA):
+        dbapi_connection.execute(f"PRAGMA {schema}.journal_mode=WAL")
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
 
 
@@ -32,7 +50,16 @@ def session_scope() -> Iterator[sessionmaker]:
         session.close()
 
 
+def begin_write(session: Session) -> None:
+    """Take SQLite's write lock now, so values read next can be written without a race."""
+    dbapi_connection = session.connection().connection.driver_connection
+    # pysqlite only opens a transaction at the first write; an open one already holds the lock
+    if not dbapi_connection.in_transaction:
+        dbapi_connection.execute("BEGIN IMMEDIATE")
+
+
 def init_db() -> None:
     from . import models  # noqa: F401
 
     models.Base.metadata.create_all(bind=engine)
+    models.archive_metadata.create_all(bind=engine)
@@ -0,0 +1,222 @@
+"""Replay a weighted mix of API calls at a fixed request rate.
+
+The app is driven in-process through ``httpx.ASGITransport`` against a
+scratch database unless a base URL of a running server (e.g. a local
+uvicorn) is given.  Requests are
+scheduled open-loop: latency is measured from the planned send time, so time
+spent queueing behind a saturated server shows up in the percentiles.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+DEFAULT_MIX = {
+    "generate": 30,
+    "list": 15,
+    "search": 10,
+    "detail": 15,
+    "history": 10,
+    "reminder": 10,
+    "pdf": 5,
+    "csv": 5,
+}
+
+SAMPLE_LINES = [
+    "目的: リリース準備の進捗確認",
+    "決定事項: QA を 10/25 までに完了",
+    "宿題: 田中 -> テスト計画更新",
+    "佐藤 -> リリースノート作成（11/1まで）",
+    "議事要旨: 全体の進捗は順調",
+    "- 監視設定の見直し",
+    "- 顧客向け告知文の確認",
+    "次回は来週水曜日に実施",
+]
+PARTICIPANTS = ["田中", "佐藤", "鈴木", "高橋", "伊藤"]
+
+RequestSpec = Tuple[str, str, Dict[str, Any]]
+
+
+@dataclass
+class RouteStats:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def percentile(self, ratio: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(ratio * len(ordered)))]
+
+
+def _source_text(rng: random.Random) -> str:
+    return "\n".join(rng.sample(SAMPLE_LINES, rng.randint(3, len(SAMPLE_LINES))))
+
+
+def _minutes_payload(rng: random.Random) -> Dict[str, Any]:
+    meeting_date = dt.date.today() - dt.timedelta(days=rng.randint(0, 365))
+    return {
+        "title": f"定例会議 {rng.randint(1, 500)}",
+        "meeting_date": meeting_date.isoformat(),
+        "participants": rng.sample(PARTICIPANTS, 2),
+        "raw_input": _source_text(rng),
+        "purpose": "リリース準備の進捗確認",
+        "decisions": "QA を 10/25 までに完了",
+        "action_items": "田中 -> テスト計画更新\n佐藤 -> リリースノート作成（11/1まで）",
+        "digest": "全体の進捗は順調",
+    }
+
+
+def _generate(rng: random.Random, ids: List[int]) -> RequestSpec:
+    payload = {
+        "title": "開発定例",
+        "meeting_date": dt.date.today().isoformat(),
+        "participants": rng.sample(PARTICIPANTS, 2),
+        "text": _source_text(rng),
+        "input_mode": rng.choice(["free", "bullet"]),
+    }
+    return "POST", "/api/minutes/generate", {"json": payload}
+
+
+def _reminder(rng: random.Random, ids: List[int]) -> RequestSpec:
+    payload = {
+        "assignee": rng.choice(PARTICIPANTS),
+        "action_item": "テスト計画更新",
+        "due_date": (dt.date.today() + dt.timedelta(days=7)).isoformat(),
+    }
+    return "POST", f"/api/minutes/{rng.choice(ids)}/reminders", {"json": payload}
+
+
+ROUTES: Dict[str, Callable[[random.Random, List[int]], RequestSpec]] = {
+    "generate": _generate,
+    "list": lambda rng, ids: ("GET", "/api/minutes", {}),
+    "search": lambda rng, ids: ("GET", "/api/minutes", {"params": {"title": "定例", "participant": rng.choice(PARTICIPANTS)}}),
+    "detail": lambda rng, ids: ("GET", f"/api/minutes/{rng.choice(ids)}", {}),
+    "history": lambda rng, ids: ("GET", f"/api/minutes/{rng.choice(ids)}/history", {}),
+    "reminder": _reminder,
+    "pdf": lambda rng, ids: ("GET", f"/api/minutes/{rng.choice(ids)}/export/pdf", {}),
+    "csv": lambda rng, ids: ("GET", "/api/minutes/export/csv", {}),
+}
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """Parse ``generate=30,list=20`` into route weights."""
+    mix: Dict[str, int] = {}
+    for part in filter(None, (item.strip() for item in value.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in ROUTES:
+            raise ValueError(f"unknown route '{name}' (choose from {', '.join(ROUTES)})")
+        mix[name] = int(weight or 1)
+    if not any(mix.values()):
+        raise ValueError("mix must give at least one route a positive weight")
+    return mix
+
+
+def _client(base_url: Optional[str]) -> httpx.AsyncClient:
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, timeout=60)
+    # the database path is read when app.database is first imported
+    if f"{__package__}.database" in sys.modules:
+        raise RuntimeError("in-process load test must run before the app database is imported")
+    os.environ["MINUTES_DB_PATH"] = str(Path(tempfile.mkdtemp(prefix="minutes-loadtest-")) / "minutes.db")
+    from .main import app
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60)
+
+
+async def _seed(client: httpx.AsyncClient, rng: random.Random, count: int) -> List[int]:
+    ids: List[int] = []
+    for _ in range(count):
+        response = await client.post("/api/minutes", json=_minutes_payload(rng))
+        response.raise_for_status()
+        ids.append(response.json()["id"])
+    return ids
+
+
+async def run(
+    base_url: Optional[str] = None,
+    rate: float = 20.0,
+    duration: float = 30.0,
+    mix: Optional[Dict[str, int]] = None,
+    seed_minutes: int = 20,
+    concurrency: int = 64,
+    seed: int = 0,
+    allow_writes: bool = False,
+) -> Tuple[Dict[str, RouteStats], float]:
+    """Send ``rate * duration`` requests and return per-route stats and the elapsed time.
+
+    Seeding and the reminder route write to the target, so a run against
+    ``base_url`` needs ``allow_writes``.
+    """
+    if base_url and not allow_writes:
+        raise ValueError("load test seeds minutes and posts reminders; pass --allow-writes to write to a remote server")
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    stats = {name: RouteStats() for name in names}
+    slots = asyncio.Semaphore(concurrency)
+
+    async with _client(base_url) as client:
+        ids = await _seed(client, rng, max(seed_minutes, 1))
+
+        async def fire(name: str, planned: float) -> None:
+            method, path, kwargs = ROUTES[name](rng, ids)
+            async with slots:
+                try:
+                    response = await client.request(method, path, **kwargs)
+                    failed = response.status_code >= 400
+                except httpx.HTTPError:
+                    failed = True
+            stats[name].latencies.append(time.perf_counter() - planned)
+            if failed:
+                stats[name].errors += 1
+
+        tasks = []
+        started = time.perf_counter()
+        for index in range(int(rate * duration)):
+            planned = started + index / rate
+            delay = planned - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(fire(rng.choices(names, weights)[0], planned)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    return stats, elapsed
+
+
+def format_report(stats: Dict[str, RouteStats], elapsed: float) -> str:
+    header = f"{'route':<10}{'count':>8}{'rps':>9}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errors':>9}"
+    lines = [header, "-" * len(header)]
+    total = RouteStats()
+    for name, route in stats.items():
+        total.latencies.extend(route.latencies)
+        total.errors += route.errors
+        lines.append(_report_line(name, route, elapsed))
+    lines.append("-" * len(header))
+    lines.append(_report_line("total", total, elapsed))
+    return "\n".join(lines)
+
+
+def _report_line(name: str, route: RouteStats, elapsed: float) -> str:
+    count = len(route.latencies)
+    error_rate = route.errors / count if count else 0.0
+    return (
+        f"{name:<10}{count:>8}{count / elapsed if elapsed else 0:>9.1f}"
+        f"{route.percentile(0.5) * 1000:>10.1f}{route.percentile(0.9) * 1000:>10.1f}"
+        f"{route.percentile(0.99) * 1000:>10.1f}{max(route.latencies, default=0) * 1000:>10.1f}"
+        f"{error_rate:>9.1%}"
+    )
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from .api.routes import router
 from .database import init_db
 
+# レスポンス本文がこのサイズ（バイト）未満なら圧縮しない
+GZIP_MINIMUM_SIZE = 1024
+
 init_db()
 
 app = FastAPI(title="議事録自動生成・管理API", version="1.0.0")
@@ -18,6 +22,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+
 app.include_router(router)
 
 
@@ -1,10 +1,35 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import List, Optional
+import zlib
+from typing import Any, List, Optional
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, LargeBinary, MetaData, String, Table, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
+
+from .database import ARCHIVE_SCHEMA
+
+
+class CompressedText(TypeDecorator):
+    """Text stored as a zlib-compressed BLOB.
+
+    Rows written before compression was introduced hold plain TEXT; those are
+    returned unchanged so existing databases keep working without migration.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect: Any) -> Optional[bytes]:
+        if value is None:
+            return None
+        return zlib.compress(value.encode("utf-8"))
+
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        return zlib.decompress(value).decode("utf-8")
 
 
 class Base(DeclarativeBase):
@@ -22,12 +47,13 @@ class Minutes(Base):
     decisions: Mapped[str] = mapped_column(Text, default="")
     action_items: Mapped[str] = mapped_column(Text, default="")
     digest: Mapped[str] = mapped_column(Text, default="")
-    raw_input: Mapped[str] = mapped_column(Text, default="")
+    raw_input: Mapped[str] = mapped_column(CompressedText, default="", deferred=True)
     created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow, nullable=False)
     updated_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow, onupdate=dt.datetime.utcnow, nullable=False)
 
     versions: Mapped[List[MinutesVersion]] = relationship("MinutesVersion", back_populates="minutes", cascade="all, delete-orphan")
     reminders: Mapped[List[Reminder]] = relationship("Reminder", back_populates="minutes", cascade="all, delete-orphan")
+    action_item_records: Mapped[List[ActionItem]] = relationship("ActionItem", back_populates="minutes", cascade="all, delete-orphan")
 
 
 class MinutesVersion(Base):
@@ -57,3 +83,89 @@ class Reminder(Base):
     created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow, nullable=False)
 
     minutes: Mapped[Minutes] = relationship("Minutes", back_populates="reminders")
+
+
+class ActionItem(Base):
+    """An action item parsed out of ``Minutes.action_items``."""
+
+    __tablename__ = "action_items"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    minutes_id: Mapped[int] = mapped_column(ForeignKey("minutes.id", ondelete="CASCADE"), nullable=False, index=True)
+    assignee: Mapped[str] = mapped_column(String(255), default="", index=True)
+    task: Mapped[str] = mapped_column(Text, nullable=False)
+    due_date: Mapped[Optional[dt.date]] = mapped_column(Date, index=True)
+    status: Mapped[str] = mapped_column(String(50), default="open")
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow, nullable=False)
+
+    minutes: Mapped[Minutes] = relationship("Minutes", back_populates="action_item_records")
+
+
+class MonthlyRollup(Base):
+    """Meetings and reminders per month, maintained incrementally."""
+
+    __tablename__ = "analytics_monthly"
+
+    month: Mapped[str] = mapped_column(String(7), primary_key=True)
+    meetings: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    reminders: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class AssigneeRollup(Base):
+    """Open action items and reminders per assignee, maintained incrementally."""
+
+    __tablename__ = "analytics_assignees"
+
+    assignee: Mapped[str] = mapped_column(String(255), primary_key=True)
+    open_action_items: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
+    reminders: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class MeetingRollup(Base):
+    """Edits and reminders per meeting, maintained incrementally."""
+
+    __tablename__ = "analytics_meetings"
+
+    minutes_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    edits: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
+    reminders: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class MinutesSignature(Base):
+    """MinHash signature of a meeting's purpose, decisions and digest."""
+
+    __tablename__ = "minutes_signatures"
+
+    minutes_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    signature: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class MinutesLshBucket(Base):
+    """LSH band bucket membership used to find similar-meeting candidates."""
+
+    __tablename__ = "minutes_lsh_buckets"
+
+    band: Mapped[int] = mapped_column(Integer, primary_key=True)
+    bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    minutes_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+
+class ArchivedMinutesIndex(Base):
+    """Thin hot-DB index of minutes moved to the archive database."""
+
+    __tablename__ = "minutes_archive_index"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    meeting_date: Mapped[dt.date] = mapped_column(Date, nullable=False, index=True)
+    participants: Mapped[str] = mapped_column(String(1024), default="")
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime, nullable=False)
+    archived_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow, nullable=False)
+
+
+# Copies of the cold tables living in the attached archive database.
+archive_metadata = MetaData()
+ARCHIVED_TABLES: dict[str, Table] = {
+    name: Base.metadata.tables[name].to_metadata(archive_metadata, schema=ARCHIVE_SCHEMA)
+    for name in ("minutes", "minutes_versions", "reminders", "action_items")
+}
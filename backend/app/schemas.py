@@ -31,6 +31,43 @@ class SummaryResponse(SummarySections):
     total_characters: int
 
 
+class SummaryCacheStats(BaseModel):
+    hits: int
+    persistent_hits: int
+    misses: int
+    entries: int
+    persistent_bytes: Optional[int] = None
+
+
+class PreviewInit(BaseModel):
+    title: str = ""
+    text: str = ""
+    input_mode: str = Field("free", description="free|bullet")
+
+    @validator("input_mode")
+    def validate_mode(cls, v: str) -> str:
+        if v not in {"free", "bullet"}:
+            raise ValueError("input_mode must be 'free' or 'bullet'")
+        return v
+
+
+class PreviewSettings(BaseModel):
+    title: Optional[str] = None
+    input_mode: Optional[str] = Field(None, description="free|bullet")
+
+    @validator("input_mode")
+    def validate_mode(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and v not in {"free", "bullet"}:
+            raise ValueError("input_mode must be 'free' or 'bullet'")
+        return v
+
+
+class PreviewEdit(BaseModel):
+    start: int = Field(..., ge=0, description="置換開始行（0 始まり）")
+    end: int = Field(..., ge=0, description="置換終了行（この行を含まない）")
+    lines: List[str] = Field(default_factory=list)
+
+
 class MinutesCreateRequest(SummarySections):
     title: str
     meeting_date: dt.date
@@ -46,7 +83,7 @@ class MinutesResponse(SummarySections):
     participants: List[str]
     created_at: dt.datetime
     updated_at: dt.datetime
-    raw_input: str
+    raw_input: Optional[str] = Field(None, description="元テキスト（include_raw_input 指定時のみ）")
 
 
 class MinutesListResponse(BaseModel):
@@ -57,6 +94,13 @@ class MinutesListResponse(BaseModel):
     created_at: dt.datetime
 
 
+class RelatedMinutesResponse(BaseModel):
+    id: int
+    title: str
+    meeting_date: dt.date
+    similarity: float
+
+
 class MinutesVersionResponse(SummarySections):
     id: int
     created_at: dt.datetime
@@ -75,6 +119,33 @@ class ReminderResponse(ReminderRequest):
     created_at: dt.datetime
 
 
+class ActionItemResponse(BaseModel):
+    id: int
+    minutes_id: int
+    assignee: str
+    task: str
+    due_date: Optional[dt.date]
+    status: str
+    created_at: dt.datetime
+
+
+class ActionItemStatusRequest(BaseModel):
+    status: str = Field(..., description="open|done")
+
+    @validator("status")
+    def validate_status(cls, v: str) -> str:
+        if v not in {"open", "done"}:
+            raise ValueError("status must be 'open' or 'done'")
+        return v
+
+
+class ActionItemSearchQuery(BaseModel):
+    assignee: Optional[str] = None
+    status: Optional[str] = None
+    due_before: Optional[dt.date] = None
+    due_after: Optional[dt.date] = None
+
+
 class MinutesDetailResponse(MinutesResponse):
     versions: List[MinutesVersionResponse]
     reminders: List[ReminderResponse]
@@ -97,3 +168,21 @@ class DiffResponse(BaseModel):
 class HistoryResponse(BaseModel):
     version: MinutesVersionResponse
     diffs: List[DiffResponse]
+
+
+class MonthlyAnalyticsResponse(BaseModel):
+    month: str
+    meetings: int
+    reminders: int
+
+
+class AssigneeAnalyticsResponse(BaseModel):
+    assignee: str
+    open_action_items: int
+    reminders: int
+
+
+class MeetingAnalyticsResponse(BaseModel):
+    minutes_id: int
+    edits: int
+    reminders: int
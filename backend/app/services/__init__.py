@@ -1,3 +1,3 @@
-from . import export, minutes, notifications, summary
+from . import action_items, analytics, archive, export, minutes, notifications, preview, similarity, snapshot, summary, summary_cache
 
-__all__ = ["export", "minutes", "notifications", "summary"]
+__all__ = ["action_items", "analytics", "archive", "export", "minutes", "notifications", "preview", "similarity", "snapshot", "summary", "summary_cache"]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..schemas import ActionItemResponse, ActionItemSearchQuery, ActionItemStatusRequest
+from . import analytics
+from .summary import parse_action_items
+
+
+def sync_action_items(session: Session, minutes: models.Minutes) -> None:
+    """Bring the action_items rows of ``minutes`` in line with its action_items text.
+
+    Items whose assignee and task are unchanged keep their id and status.
+    Repeated lines are matched to existing rows one-to-one, oldest first.
+    """
+    existing: Dict[Tuple[str, str], List[models.ActionItem]] = defaultdict(list)
+    for item in sorted(minutes.action_item_records, key=lambda record: record.id or 0):
+        existing[(item.assignee, item.task)].append(item)
+    for parsed in parse_action_items(minutes.action_items or "", minutes.meeting_date):
+        matches = existing.get((parsed.assignee, parsed.task))
+        item = matches.pop(0) if matches else None
+        if item is None:
+            item = models.ActionItem(assignee=parsed.assignee, task=parsed.task, status="open")
+            minutes.action_item_records.append(item)
+            analytics.record_open_action_items(session, item.assignee, 1)
+        item.due_date = parsed.due_date
+    for stale in [item for items in existing.values() for item in items]:
+        minutes.action_item_records.remove(stale)
+        if stale.status == "open":
+            analytics.record_open_action_items(session, stale.assignee, -1)
+    session.flush()
+
+
+def list_action_items(session: Session, query: ActionItemSearchQuery) -> List[ActionItemResponse]:
+    stmt = select(models.ActionItem)
+    if query.assignee is not None:
+        stmt = stmt.where(models.ActionItem.assignee == query.assignee)
+    if query.status:
+        stmt = stmt.where(models.ActionItem.status == query.status)
+    if query.due_after:
+        stmt = stmt.where(models.ActionItem.due_date >= query.due_after)
+    if query.due_before:
+        stmt = stmt.where(models.ActionItem.due_date <= query.due_before)
+
+    stmt = stmt.order_by(models.ActionItem.due_date.is_(None), models.ActionItem.due_date, models.ActionItem.id)
+    return [map_action_item(item) for item in session.execute(stmt).scalars().all()]
+
+
+def update_status(session: Session, item_id: int, payload: ActionItemStatusRequest) -> ActionItemResponse:
+    item = session.get(models.ActionItem, item_id)
+    if not item:
+        raise ValueError("Action item not found")
+
+    if item.status != payload.status:
+        analytics.record_open_action_items(session, item.assignee, 1 if payload.status == "open" else -1)
+    item.status = payload.status
+    session.flush()
+    return map_action_item(item)
+
+
+def map_action_item(item: models.ActionItem) -> ActionItemResponse:
+    return ActionItemResponse(
+        id=item.id,
+        minutes_id=item.minutes_id,
+        assignee=item.assignee,
+        task=item.task,
+        due_date=item.due_date,
+        status=item.status,
+        created_at=item.created_at,
+    )
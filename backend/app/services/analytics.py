@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import datetime as dt
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..schemas import AssigneeAnalyticsResponse, MeetingAnalyticsResponse, MonthlyAnalyticsResponse
+
+# Rollups cover archived minutes too, so archiving never changes the numbers,
+# except open action items: archived ones can no longer be listed or closed.
+
+
+def month_of(date: dt.date) -> str:
+    return date.strftime("%Y-%m")
+
+
+def _bump(session: Session, model, key: Dict[str, object], **deltas: int) -> None:
+    table = model.__table__
+    stmt = insert(table).values(**key, **deltas)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={name: table.c[name] + delta for name, delta in deltas.items()},
+    )
+    session.execute(stmt)
+
+
+def record_minutes_created(session: Session, minutes: models.Minutes) -> None:
+    _bump(session, models.MonthlyRollup, {"month": month_of(minutes.meeting_date)}, meetings=1)
+    _bump(session, models.MeetingRollup, {"minutes_id": minutes.id}, edits=0)
+
+
+def record_minutes_updated(session: Session, minutes: models.Minutes, previous_date: dt.date) -> None:
+    if month_of(previous_date) != month_of(minutes.meeting_date):
+        _bump(session, models.MonthlyRollup, {"month": month_of(previous_date)}, meetings=-1)
+        _bump(session, models.MonthlyRollup, {"month": month_of(minutes.meeting_date)}, meetings=1)
+    _bump(session, models.MeetingRollup, {"minutes_id": minutes.id}, edits=1)
+
+
+def record_reminder(session: Session, reminder: models.Reminder) -> None:
+    _bump(session, models.MonthlyRollup, {"month": month_of(reminder.due_date)}, reminders=1)
+    _bump(session, models.AssigneeRollup, {"assignee": reminder.assignee}, reminders=1)
+    _bump(session, models.MeetingRollup, {"minutes_id": reminder.minutes_id}, reminders=1)
+
+
+def record_open_action_items(session: Session, assignee: str, delta: int) -> None:
+    if delta:
+        _bump(session, models.AssigneeRollup, {"assignee": assignee}, open_action_items=delta)
+
+
+def meetings_per_month(session: Session, start: Optional[str] = None, end: Optional[str] = None) -> List[MonthlyAnalyticsResponse]:
+    # months emptied by a date change keep a zero row until the next rebuild
+    stmt = select(models.MonthlyRollup).where(or_(models.MonthlyRollup.meetings > 0, models.MonthlyRollup.reminders > 0))
+    if start:
+        stmt = stmt.where(models.MonthlyRollup.month >= start)
+    if end:
+        stmt = stmt.where(models.MonthlyRollup.month <= end)
+    rows = session.execute(stmt.order_by(models.MonthlyRollup.month)).scalars().all()
+    return [MonthlyAnalyticsResponse(month=row.month, meetings=row.meetings, reminders=row.reminders) for row in rows]
+
+
+def open_action_items_per_assignee(session: Session, limit: int) -> List[AssigneeAnalyticsResponse]:
+    stmt = (
+        select(models.AssigneeRollup)
+        .where(models.AssigneeRollup.open_action_items > 0)
+        .order_by(models.AssigneeRollup.open_action_items.desc())
+        .limit(limit)
+    )
+    return [
+        AssigneeAnalyticsResponse(assignee=row.assignee, open_action_items=row.open_action_items, reminders=row.reminders)
+        for row in session.execute(stmt).scalars().all()
+    ]
+
+
+def edits_per_meeting(session: Session, limit: int) -> List[MeetingAnalyticsResponse]:
+    stmt = select(models.MeetingRollup).order_by(models.MeetingRollup.edits.desc()).limit(limit)
+    return [
+        MeetingAnalyticsResponse(minutes_id=row.minutes_id, edits=row.edits, reminders=row.reminders)
+        for row in session.execute(stmt).scalars().all()
+    ]
+
+
+def rebuild(session: Session) -> None:
+    """Recompute every rollup from the hot and archived tables (open action items from the hot table only)."""
+    monthly: Dict[str, Counter] = {}
+    assignees: Dict[str, Counter] = {}
+    meetings: Dict[int, Counter] = {}
+
+    for tables in (models.Base.metadata.tables, models.ARCHIVED_TABLES):
+        minutes, versions = tables["minutes"], tables["minutes_versions"]
+        reminders = tables["reminders"]
+
+        month = func.strftime("%Y-%m", minutes.c.meeting_date)
+        for value, count in session.execute(select(month, func.count()).group_by(month)):
+            monthly.setdefault(value, Counter())["meetings"] += count
+        for minutes_id, count in session.execute(
+            select(versions.c.minutes_id, func.count()).group_by(versions.c.minutes_id)
+        ):
+            meetings.setdefault(minutes_id, Counter())["edits"] += max(count - 1, 0)
+
+        due_month = func.strftime("%Y-%m", reminders.c.due_date)
+        for value, count in session.execute(select(due_month, func.count()).group_by(due_month)):
+            monthly.setdefault(value, Counter())["reminders"] += count
+        for assignee, count in session.execute(
+            select(reminders.c.assignee, func.count()).group_by(reminders.c.assignee)
+        ):
+            assignees.setdefault(assignee, Counter())["reminders"] += count
+        for minutes_id, count in session.execute(
+            select(reminders.c.minutes_id, func.count()).group_by(reminders.c.minutes_id)
+        ):
+            meetings.setdefault(minutes_id, Counter())["reminders"] += count
+
+    action_items = models.ActionItem
+    for assignee, count in session.execute(
+        select(action_items.assignee, func.count())
+        .where(action_items.status == "open")
+        .group_by(action_items.assignee)
+    ):
+        assignees.setdefault(assignee, Counter())["open_action_items"] += count
+
+    for model in (models.MonthlyRollup, models.AssigneeRollup, models.MeetingRollup):
+        session.execute(delete(model))
+    _insert_rows(session, models.MonthlyRollup, "month", monthly, ("meetings", "reminders"))
+    _insert_rows(session, models.AssigneeRollup, "assignee", assignees, ("open_action_items", "reminders"))
+    _insert_rows(session, models.MeetingRollup, "minutes_id", meetings, ("edits", "reminders"))
+
+
+def _insert_rows(session: Session, model, key: str, counters: Dict, fields: Tuple[str, ...]) -> None:
+    rows = [{key: value, **{field: counter[field] for field in fields}} for value, counter in counters.items()]
+    if rows:
+        session.execute(insert(model.__table__), rows)
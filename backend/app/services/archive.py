@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..database import begin_write
+from . import analytics
+
+# 既定では会議日から 2 年を過ぎた議事録をアーカイブ対象とする
+ARCHIVE_AFTER_DAYS = 365 * 2
+
+# Child tables are listed before ``minutes`` so deletes respect foreign keys.
+CHILD_TABLES = ("minutes_versions", "reminders", "action_items")
+
+
+@dataclass
+class ArchivedMinutes:
+    minutes: Row
+    versions: List[Row]
+    reminders: List[Row]
+
+
+def archive_minutes(session: Session, older_than_days: int = ARCHIVE_AFTER_DAYS, today: Optional[dt.date] = None) -> int:
+    """Move minutes held before the cutoff, with their versions, reminders and action items, to the archive DB."""
+    cutoff = (today or dt.date.today()) - dt.timedelta(days=older_than_days)
+    hot = models.Base.metadata.tables
+    cold = models.ARCHIVED_TABLES
+    minutes_table = hot["minutes"]
+    ids = select(minutes_table.c.id).where(minutes_table.c.meeting_date < cutoff)
+
+    count = session.scalar(select(func.count()).select_from(ids.subquery()))
+    if not count:
+        return 0
+
+    # archived action items can no longer be listed or closed, so they leave the open counts
+    action_items = hot["action_items"]
+    for assignee, open_count in session.execute(
+        select(action_items.c.assignee, func.count())
+        .where(action_items.c.minutes_id.in_(ids), action_items.c.status == "open")
+        .group_by(action_items.c.assignee)
+    ):
+        analytics.record_open_action_items(session, assignee, -open_count)
+
+    index_table = models.ArchivedMinutesIndex.__table__
+    session.execute(
+        insert(index_table).from_select(
+            ["id", "title", "meeting_date", "participants", "created_at", "archived_at"],
+            select(
+                minutes_table.c.id,
+                minutes_table.c.title,
+                minutes_table.c.meeting_date,
+                minutes_table.c.participants,
+                minutes_table.c.created_at,
+                literal(dt.datetime.utcnow()),
+            ).where(minutes_table.c.id.in_(ids)),
+        )
+    )
+    session.execute(
+        insert(cold["minutes"]).from_select(
+            list(minutes_table.c.keys()), select(minutes_table).where(minutes_table.c.id.in_(ids))
+        )
+    )
+    for name in CHILD_TABLES:
+        table = hot[name]
+        # child ids are not copied: SQLite reuses rowids freed here, so the archive numbers its own rows
+        columns = [column for column in table.c if column.key != "id"]
+        session.execute(
+            insert(cold[name]).from_select(
+                [column.key for column in columns],
+                select(*columns).where(table.c.minutes_id.in_(ids)).order_by(table.c.id),
+            )
+        )
+        session.execute(delete(table).where(table.c.minutes_id.in_(ids)))
+    session.execute(delete(minutes_table).where(minutes_table.c.id.in_(ids)))
+    session.expire_all()
+    return count
+
+
+def get_archived(session: Session, minutes_id: int) -> Optional[ArchivedMinutes]:
+    # the hot index is checked first so misses never touch the archive file
+    if session.get(models.ArchivedMinutesIndex, minutes_id) is None:
+        return None
+
+    cold = models.ARCHIVED_TABLES
+    minutes = session.execute(select(cold["minutes"]).where(cold["minutes"].c.id == minutes_id)).first()
+    if minutes is None:
+        return None
+    versions = session.execute(
+        select(cold["minutes_versions"]).where(cold["minutes_versions"].c.minutes_id == minutes_id)
+    ).all()
+    reminders = session.execute(select(cold["reminders"]).where(cold["reminders"].c.minutes_id == minutes_id)).all()
+    return ArchivedMinutes(minutes=minutes, versions=list(versions), reminders=list(reminders))
+
+
+def next_minutes_id(session: Session) -> Optional[int]:
+    """Return an explicit id for new minutes when SQLite could reuse an archived one.
+
+    SQLite hands out ``max(rowid) + 1``; once the newest rows have been
+    archived that value may collide with an id already in the archive index.
+    The write lock is taken first, so concurrent creates cannot pick the same id.
+    """
+    begin_write(session)
+    archived_max = session.scalar(select(func.max(models.ArchivedMinutesIndex.id)))
+    if archived_max is None:
+        return None
+    hot_max = session.scalar(select(func.max(models.Minutes.id))) or 0
+    return archived_max + 1 if archived_max >= hot_max else None
@@ -19,11 +19,13 @@ from ..schemas import (
     ReminderRequest,
     ReminderResponse,
 )
+from . import action_items, analytics, archive, similarity
 from .summary import MAX_CHARACTERS
 
 
 def create_minutes(session: Session, payload: MinutesCreateRequest) -> MinutesResponse:
     minutes = models.Minutes(
+        id=archive.next_minutes_id(session),
         title=payload.title,
         meeting_date=payload.meeting_date,
         participants=",".join(payload.participants),
@@ -45,6 +47,9 @@ def create_minutes(session: Session, payload: MinutesCreateRequest) -> MinutesRe
     )
     session.add(version)
     session.flush()
+    action_items.sync_action_items(session, minutes)
+    similarity.index_minutes(session, minutes)
+    analytics.record_minutes_created(session, minutes)
     return map_minutes(minutes)
 
 
@@ -53,6 +58,7 @@ def update_minutes(session: Session, minutes_id: int, payload: MinutesCreateRequ
     if not minutes:
         raise ValueError("Minutes not found")
 
+    previous_date = minutes.meeting_date
     minutes.title = payload.title
     minutes.meeting_date = payload.meeting_date
     minutes.participants = ",".join(payload.participants)
@@ -72,10 +78,16 @@ def update_minutes(session: Session, minutes_id: int, payload: MinutesCreateRequ
     )
     session.add(version)
     session.flush()
+    action_items.sync_action_items(session, minutes)
+    similarity.index_minutes(session, minutes)
+    analytics.record_minutes_updated(session, minutes, previous_date)
     return map_minutes(minutes)
 
 
-def map_minutes(minutes: models.Minutes) -> MinutesResponse:
+def map_minutes(minutes: models.Minutes, include_raw_input: bool = False) -> MinutesResponse:
+    # raw_input is deferred and compressed; only load it when asked for so that
+    # it stays out of the default payloads.
+    extra = {"raw_input": minutes.raw_input} if include_raw_input else {}
     return MinutesResponse(
         id=minutes.id,
         title=minutes.title,
@@ -85,25 +97,32 @@ def map_minutes(minutes: models.Minutes) -> MinutesResponse:
         decisions=minutes.decisions,
         action_items=minutes.action_items,
         digest=minutes.digest,
-        raw_input=minutes.raw_input,
         created_at=minutes.created_at,
         updated_at=minutes.updated_at,
+        **extra,
     )
 
 
-def list_minutes(session: Session, query: MinutesSearchQuery) -> List[MinutesListResponse]:
-    stmt = select(models.Minutes)
+def _apply_search(stmt, entity, query: MinutesSearchQuery):
     if query.title:
-        stmt = stmt.where(models.Minutes.title.ilike(f"%{query.title}%"))
+        stmt = stmt.where(entity.title.ilike(f"%{query.title}%"))
     if query.participant:
-        stmt = stmt.where(models.Minutes.participants.ilike(f"%{query.participant}%"))
+        stmt = stmt.where(entity.participants.ilike(f"%{query.participant}%"))
     if query.start_date:
-        stmt = stmt.where(models.Minutes.meeting_date >= query.start_date)
+        stmt = stmt.where(entity.meeting_date >= query.start_date)
     if query.end_date:
-        stmt = stmt.where(models.Minutes.meeting_date <= query.end_date)
+        stmt = stmt.where(entity.meeting_date <= query.end_date)
+    return stmt.order_by(entity.meeting_date.desc())
+
 
-    stmt = stmt.order_by(models.Minutes.meeting_date.desc())
-    results = session.execute(stmt).scalars().all()
+def list_minutes(session: Session, query: MinutesSearchQuery) -> List[MinutesListResponse]:
+    results = session.execute(_apply_search(select(models.Minutes), models.Minutes, query)).scalars().all()
+    # archived minutes are listed from the thin index without opening the archive
+    archived = session.execute(
+        _apply_search(select(models.ArchivedMinutesIndex), models.ArchivedMinutesIndex, query)
+    ).scalars().all()
+    if archived:
+        results = sorted([*results, *archived], key=lambda item: item.meeting_date, reverse=True)
     return [
         MinutesListResponse(
             id=item.id,
@@ -116,12 +135,19 @@ def list_minutes(session: Session, query: MinutesSearchQuery) -> List[MinutesLis
     ]
 
 
-def get_minutes_detail(session: Session, minutes_id: int) -> MinutesDetailResponse:
+def get_minutes_detail(session: Session, minutes_id: int, include_raw_input: bool = False) -> MinutesDetailResponse:
     minutes = session.get(models.Minutes, minutes_id)
-    if not minutes:
+    if minutes:
+        return build_detail(minutes, minutes.versions, minutes.reminders, include_raw_input)
+
+    archived = archive.get_archived(session, minutes_id)
+    if not archived:
         raise ValueError("Minutes not found")
+    return build_detail(archived.minutes, archived.versions, archived.reminders, include_raw_input)
+
 
-    versions = [
+def build_detail(minutes, versions: Iterable, reminders: Iterable, include_raw_input: bool = False) -> MinutesDetailResponse:
+    version_responses = [
         MinutesVersionResponse(
             id=version.id,
             purpose=version.purpose,
@@ -131,10 +157,10 @@ def get_minutes_detail(session: Session, minutes_id: int) -> MinutesDetailRespon
             editor=version.editor,
             created_at=version.created_at,
         )
-        for version in sorted(minutes.versions, key=lambda v: v.created_at, reverse=True)
+        for version in sorted(versions, key=lambda v: v.created_at, reverse=True)
     ]
 
-    reminders = [
+    reminder_responses = [
         ReminderResponse(
             id=reminder.id,
             assignee=reminder.assignee,
@@ -143,13 +169,13 @@ def get_minutes_detail(session: Session, minutes_id: int) -> MinutesDetailRespon
             status=reminder.status,
             created_at=reminder.created_at,
         )
-        for reminder in sorted(minutes.reminders, key=lambda r: r.due_date)
+        for reminder in sorted(reminders, key=lambda r: r.due_date)
     ]
 
     return MinutesDetailResponse(
-        **map_minutes(minutes).dict(),
-        versions=versions,
-        reminders=reminders,
+        **map_minutes(minutes, include_raw_input).dict(exclude_unset=True),
+        versions=version_responses,
+        reminders=reminder_responses,
     )
 
 
@@ -167,6 +193,7 @@ def record_reminder(session: Session, minutes_id: int, payload: ReminderRequest)
     )
     session.add(reminder)
     session.flush()
+    analytics.record_reminder(session, reminder)
     return ReminderResponse(
         id=reminder.id,
         assignee=reminder.assignee,
@@ -179,12 +206,17 @@ def record_reminder(session: Session, minutes_id: int, payload: ReminderRequest)
 
 def list_history(session: Session, minutes_id: int) -> List[HistoryResponse]:
     minutes = session.get(models.Minutes, minutes_id)
-    if not minutes:
-        raise ValueError("Minutes not found")
+    if minutes:
+        versions = minutes.versions
+    else:
+        archived = archive.get_archived(session, minutes_id)
+        if not archived:
+            raise ValueError("Minutes not found")
+        versions = archived.versions
 
     history: List[HistoryResponse] = []
     previous = None
-    for version in sorted(minutes.versions, key=lambda v: v.created_at):
+    for version in sorted(versions, key=lambda v: v.created_at):
         current = version
         if previous:
             diffs = compute_diffs(previous, current)
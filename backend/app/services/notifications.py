@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from .. import models
 from ..schemas import ReminderRequest, ReminderResponse
+from . import analytics
 
 
 class NotificationLog:
@@ -37,6 +38,7 @@ def dispatch_reminder(session: Session, minutes_id: int, reminder: ReminderReque
     )
     session.add(entry)
     session.flush()
+    analytics.record_reminder(session, entry)
 
     notification_log.record(
         f"Reminder sent to {entry.assignee} for '{entry.action_item}' due {entry.due_date.isoformat()}"
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..schemas import PreviewEdit, PreviewInit, PreviewSettings, SummaryResponse
+from .summary import SECTION_KEYS, ParsedSections, build_summary, classify_line
+
+# (section in effect after the line, bucket, stored text); blank lines are None
+LineEntry = Optional[Tuple[Optional[str], str, str]]
+
+
+@dataclass
+class PreviewSession:
+    """Per-connection parser state for the live summary preview.
+
+    The source text is kept as a list of editor lines together with the
+    classification of each line.  Edits replace a range of lines; only the
+    replaced lines and the following lines whose section context changed are
+    classified again.
+    """
+
+    title: str = ""
+    input_mode: str = "free"
+    lines: List[str] = field(default_factory=list)
+    entries: List[LineEntry] = field(default_factory=list)
+
+    def apply(self, message: Any) -> SummaryResponse:
+        kind = message.get("type") if isinstance(message, dict) else None
+        if kind == "init":
+            self.reset(PreviewInit(**message))
+        elif kind == "edit":
+            self.edit(PreviewEdit(**message))
+        elif kind == "settings":
+            self.configure(PreviewSettings(**message))
+        else:
+            raise ValueError("message type must be 'init', 'edit' or 'settings'")
+        return self.summary()
+
+    def reset(self, payload: PreviewInit) -> None:
+        self.title = payload.title
+        self.input_mode = payload.input_mode
+        self.lines = payload.text.split("\n")
+        self.entries = []
+        self._reparse(0, len(self.lines), [], None)
+
+    def configure(self, payload: PreviewSettings) -> None:
+        """Change the title or input mode without re-sending the text."""
+        if payload.title is not None:
+            self.title = payload.title
+        if payload.input_mode is not None and payload.input_mode != self.input_mode:
+            self.input_mode = payload.input_mode
+            self.entries = []
+            self._reparse(0, len(self.lines), [], None)
+
+    def edit(self, payload: PreviewEdit) -> None:
+        if payload.start > payload.end or payload.end > len(self.lines):
+            raise ValueError("edit range is out of bounds")
+        if any("\n" in line for line in payload.lines):
+            raise ValueError("edited lines must not contain line breaks")
+
+        previous = self.entries[payload.end :]
+        previous_key = self._state_before(payload.end)
+        self.lines[payload.start : payload.end] = payload.lines
+        del self.entries[payload.start :]
+        self._reparse(payload.start, payload.start + len(payload.lines), previous, previous_key)
+
+    def summary(self) -> SummaryResponse:
+        buckets: Dict[str, List[str]] = {k: [] for k in [*SECTION_KEYS, "remainder"]}
+        for entry in self.entries:
+            if entry is not None:
+                buckets[entry[1]].append(entry[2])
+        parsed = ParsedSections(
+            purpose=buckets["purpose"],
+            decisions=buckets["decisions"],
+            action_items=buckets["action_items"],
+            digest=buckets["digest"],
+            remainder=buckets["remainder"],
+        )
+        return build_summary(self.title, parsed)
+
+    def _state_before(self, index: int) -> Optional[str]:
+        for position in range(index - 1, -1, -1):
+            entry = self.entries[position]
+            if entry is not None:
+                return entry[0]
+        return None
+
+    def _reparse(self, start: int, stop: int, previous: List[LineEntry], old_key: Optional[str]) -> None:
+        """Classify lines ``start:stop`` and then the untouched tail.
+
+        ``previous`` holds the old entries of the tail and ``old_key`` the
+        section that was in effect before it.  Once the section in effect
+        before a tail line matches what it was before the edit, the remaining
+        old entries are still valid and are reused as-is.
+        """
+        current_key = self._state_before(start)
+        for line in self.lines[start:stop]:
+            current_key = self._classify(line, current_key)
+
+        for offset, old_entry in enumerate(previous):
+            if current_key == old_key:
+                self.entries.extend(previous[offset:])
+                return
+            current_key = self._classify(self.lines[stop + offset], current_key)
+            if old_entry is not None:
+                old_key = old_entry[0]
+
+    def _classify(self, line: str, current_key: Optional[str]) -> Optional[str]:
+        stripped = line.strip()
+        if not stripped:
+            self.entries.append(None)
+            return current_key
+        current_key, bucket, content = classify_line(stripped, current_key, self.input_mode)
+        self.entries.append((current_key, bucket, content))
+        return current_key
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import struct
+from array import array
+from typing import Dict, List, Set
+
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..schemas import RelatedMinutesResponse
+
+# 日本語は分かち書きがないため文字 n-gram で比較する
+NGRAM_SIZE = 2
+NUM_BANDS = 20
+ROWS_PER_BAND = 3
+NUM_PERMUTATIONS = NUM_BANDS * ROWS_PER_BAND
+CANDIDATE_LIMIT = 200
+
+_PRIME = (1 << 61) - 1
+# fixed seed: stored signatures must stay comparable across restarts
+_rng = random.Random(20251019)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERMUTATIONS)]
+_WHITESPACE = re.compile(r"\s+")
+
+
+def shingles(text: str) -> Set[int]:
+    normalized = _WHITESPACE.sub("", text).lower()
+    grams = {normalized[i : i + NGRAM_SIZE] for i in range(max(len(normalized) - NGRAM_SIZE + 1, 0))}
+    return {int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big") for gram in grams}
+
+
+def signature(text: str) -> List[int]:
+    hashed = shingles(text)
+    if not hashed:
+        return []
+    return [min((a * value + b) % _PRIME for value in hashed) for a, b in _PERMUTATIONS]
+
+
+def band_buckets(values: List[int]) -> List[int]:
+    buckets = []
+    for band in range(NUM_BANDS):
+        rows = values[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(struct.pack(f">{ROWS_PER_BAND}Q", *rows), digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, "big", signed=True))
+    return buckets
+
+
+def index_minutes(session: Session, minutes) -> None:
+    """(Re)index one meeting; ``minutes`` needs ``id``, ``purpose``, ``decisions`` and ``digest``."""
+    session.execute(delete(models.MinutesLshBucket).where(models.MinutesLshBucket.minutes_id == minutes.id))
+    session.execute(delete(models.MinutesSignature).where(models.MinutesSignature.minutes_id == minutes.id))
+    values = signature("\n".join(filter(None, [minutes.purpose, minutes.decisions, minutes.digest])))
+    if not values:
+        return
+
+    session.execute(
+        models.MinutesSignature.__table__.insert(),
+        [{"minutes_id": minutes.id, "signature": array("Q", values).tobytes()}],
+    )
+    session.execute(
+        models.MinutesLshBucket.__table__.insert(),
+        [
+            {"band": band, "bucket": bucket, "minutes_id": minutes.id}
+            for band, bucket in enumerate(band_buckets(values))
+        ],
+    )
+
+
+def rebuild(session: Session) -> int:
+    """Re-index every hot and archived meeting; returns the number indexed."""
+    session.execute(delete(models.MinutesLshBucket))
+    session.execute(delete(models.MinutesSignature))
+    count = 0
+    for table in (models.Minutes.__table__, models.ARCHIVED_TABLES["minutes"]):
+        rows = session.execute(select(table.c.id, table.c.purpose, table.c.decisions, table.c.digest)).all()
+        for row in rows:
+            index_minutes(session, row)
+        count += len(rows)
+    return count
+
+
+def related_minutes(session: Session, minutes_id: int, limit: int = 5) -> List[RelatedMinutesResponse]:
+    stored = session.get(models.MinutesSignature, minutes_id)
+    if stored is None:
+        if not session.get(models.Minutes, minutes_id) and not session.get(models.ArchivedMinutesIndex, minutes_id):
+            raise ValueError("Minutes not found")
+        return []
+    values = array("Q", stored.signature)
+
+    bucket_table = models.MinutesLshBucket
+    matches = or_(
+        *[
+            and_(bucket_table.band == band, bucket_table.bucket == bucket)
+            for band, bucket in enumerate(band_buckets(list(values)))
+        ]
+    )
+    candidates = session.execute(
+        select(bucket_table.minutes_id)
+        .where(matches, bucket_table.minutes_id != minutes_id)
+        .group_by(bucket_table.minutes_id)
+        .order_by(func.count().desc())
+        .limit(CANDIDATE_LIMIT)
+    ).scalars().all()
+    if not candidates:
+        return []
+
+    scores: Dict[int, float] = {}
+    for candidate in session.execute(
+        select(models.MinutesSignature).where(models.MinutesSignature.minutes_id.in_(candidates))
+    ).scalars():
+        other = array("Q", candidate.signature)
+        scores[candidate.minutes_id] = sum(1 for x, y in zip(values, other) if x == y) / NUM_PERMUTATIONS
+    top = sorted(scores, key=lambda key: scores[key], reverse=True)[:limit]
+
+    # archived meetings stay searchable through the hot archive index
+    titles = {}
+    for model in (models.Minutes, models.ArchivedMinutesIndex):
+        for row in session.execute(select(model.id, model.title, model.meeting_date).where(model.id.in_(top))):
+            titles[row.id] = row
+    return [
+        RelatedMinutesResponse(
+            id=key,
+            title=titles[key].title,
+            meeting_date=titles[key].meeting_date,
+            similarity=round(scores[key], 3),
+        )
+        for key in top
+        if key in titles
+    ]
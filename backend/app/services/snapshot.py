@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import io
+import json
+import zlib
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import Date, DateTime, func, insert, select
+from sqlalchemy.engine import Connection
+
+from .. import models
+from ..database import engine
+
+SNAPSHOT_VERSION = 1
+# parents first so a restore never inserts a child before its minutes row
+SNAPSHOT_TABLES = ("minutes", "minutes_versions", "reminders", "action_items")
+FETCH_BATCH_SIZE = 1000
+RESTORE_BATCH_SIZE = 10000
+
+
+@contextmanager
+def read_snapshot_connection() -> Iterator[Connection]:
+    """Yield a connection holding one read transaction, so every table is read from the same state.
+
+    The database runs in WAL mode, so writes made while the snapshot streams
+    go ahead and are simply not part of it.
+    """
+    with engine.connect() as connection:
+        # pysqlite only opens transactions before writes; start one explicitly for the reads
+        connection.exec_driver_sql("BEGIN")
+        try:
+            yield connection
+        finally:
+            connection.rollback()
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, (dt.date, dt.datetime)):
+        return value.isoformat()
+    return value
+
+
+def iter_ndjson(connection: Connection) -> Iterator[bytes]:
+    """Yield the snapshot as NDJSON, one batch of rows per chunk.
+
+    Archived rows are written under the same table names as hot rows, so a
+    restore brings every meeting back into the hot database.  Archived child
+    rows are numbered separately from hot ones and are written without an id.
+    """
+    header = {"snapshot": SNAPSHOT_VERSION, "created_at": dt.datetime.utcnow().isoformat(), "tables": SNAPSHOT_TABLES}
+    yield (json.dumps(header) + "\n").encode("utf-8")
+    for name in SNAPSHOT_TABLES:
+        archived = models.ARCHIVED_TABLES[name]
+        for table in (models.Base.metadata.tables[name], archived):
+            columns = list(table.c)
+            if table is archived and name != "minutes":
+                columns.remove(table.c.id)
+            result = connection.execute(select(*columns).order_by(table.c.id))
+            while True:
+                rows = result.fetchmany(FETCH_BATCH_SIZE)
+                if not rows:
+                    break
+                lines = (
+                    json.dumps(
+                        {"table": name, "row": {key: _encode(value) for key, value in row._mapping.items()}},
+                        ensure_ascii=False,
+                    )
+                    for row in rows
+                )
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 writes the gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_snapshot() -> Iterator[bytes]:
+    with read_snapshot_connection() as connection:
+        yield from gzip_chunks(iter_ndjson(connection))
+
+
+def _open_text(source: io.BufferedReader) -> IO[str]:
+    # accept both the gzip file and NDJSON already decompressed by an HTTP client
+    if source.peek(2)[:2] == b"\x1f\x8b":
+        return io.TextIOWrapper(gzip.GzipFile(fileobj=source), encoding="utf-8")
+    return io.TextIOWrapper(source, encoding="utf-8")
+
+
+def _decoders(name: str) -> Dict[str, Callable[[str], Any]]:
+    decoders: Dict[str, Callable[[str], Any]] = {}
+    for column in models.Base.metadata.tables[name].columns:
+        if isinstance(column.type, DateTime):
+            decoders[column.name] = dt.datetime.fromisoformat
+        elif isinstance(column.type, Date):
+            decoders[column.name] = dt.date.fromisoformat
+    return decoders
+
+
+def restore_snapshot(source: io.BufferedReader, progress: Optional[Callable[[int], None]] = None) -> int:
+    """Bulk-load a snapshot into an empty database; returns the number of rows restored."""
+    with engine.connect() as connection:
+        if connection.scalar(select(func.count()).select_from(models.Minutes)) or connection.scalar(
+            select(func.count()).select_from(models.ArchivedMinutesIndex)
+        ):
+            raise ValueError("restore target database is not empty")
+
+    text = _open_text(source)
+    header = json.loads(text.readline() or "{}")
+    if header.get("snapshot") != SNAPSHOT_VERSION:
+        raise ValueError("unsupported snapshot format")
+
+    decoders = {name: _decoders(name) for name in SNAPSHOT_TABLES}
+    pending: Dict[str, List[Dict[str, Any]]] = {name: [] for name in SNAPSHOT_TABLES}
+    restored = 0
+
+    def flush(name: str) -> None:
+        nonlocal restored
+        rows = pending[name]
+        if not rows:
+            return
+        with engine.begin() as connection:
+            connection.execute(insert(models.Base.metadata.tables[name]), rows)
+        restored += len(rows)
+        pending[name] = []
+        if progress:
+            progress(restored)
+
+    for line in text:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        name = record["table"]
+        if name not in pending:
+            raise ValueError(f"unknown table '{name}' in snapshot")
+        row = record["row"]
+        for column, decode in decoders[name].items():
+            if row.get(column) is not None:
+                row[column] = decode(row[column])
+        # rows without an id (archived children) go in a separate executemany after the ones with ids
+        if pending[name] and pending[name][0].keys() != row.keys():
+            flush(name)
+        pending[name].append(row)
+        if len(pending[name]) >= RESTORE_BATCH_SIZE:
+            flush(name)
+
+    for name in SNAPSHOT_TABLES:
+        flush(name)
+    return restored
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import datetime as dt
 import itertools
 import re
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ..schemas import SummaryRequest, SummaryResponse
 
@@ -18,6 +19,29 @@ SECTION_HEADERS = {
 
 BULLET_PATTERN = re.compile(r"^[-*・\d\.\)]\s*")
 
+SECTION_KEYS = ["purpose", "decisions", "action_items", "digest"]
+
+ASSIGNEE_SEPARATOR = re.compile(r"\s*(?:->|→|=>|⇒)\s*")
+# 宿題の行頭は本物の箇条書き記号だけを外す（「3班」「10/25までに」の数字は残す）
+ACTION_BULLET_PATTERN = re.compile(r"^(?:[-*]\s+|・\s*|\d+[.)]\s+)")
+DATE_EXPRESSION = (
+    r"(?<!\d)(?:(?P<iso_year>\d{4})[-/](?P<iso_month>\d{1,2})[-/](?P<iso_day>\d{1,2})"
+    r"|(?:(?P<jp_year>\d{4})年)?(?P<jp_month>\d{1,2})月(?P<jp_day>\d{1,2})日"
+    r"|(?P<month>\d{1,2})/(?P<day>\d{1,2}))(?!\d)"
+)
+DUE_DATE_MARKER = r"(?:期限|締切|〆切)\s*[:：]?\s*"
+# Tried in order.  A bare date in the middle of a task (「1/2 の資料を確認」) is not a due date.
+DUE_DATE_PATTERNS = (
+    # （10/25まで） / (期限: 2025-10-25)
+    re.compile(r"\s*[（(]\s*(?:" + DUE_DATE_MARKER + r")?" + DATE_EXPRESSION + r"\s*(?:までに?)?\s*[）)]"),
+    # 期限: 10/25 / 締切 11月1日まで
+    re.compile(DUE_DATE_MARKER + DATE_EXPRESSION + r"(?:\s*までに?)?"),
+    # 10/25までに
+    re.compile(DATE_EXPRESSION + r"\s*までに?"),
+    # 見積提出 10/25
+    re.compile(r"\s*" + DATE_EXPRESSION + r"\s*$"),
+)
+
 
 @dataclass
 class ParsedSections:
@@ -28,41 +52,94 @@ class ParsedSections:
     remainder: List[str]
 
 
+def classify_line(line: str, current_key: Optional[str], input_mode: str) -> Tuple[Optional[str], str, str]:
+    """Classify one stripped line given the section in effect before it.
+
+    Returns the section in effect after the line, the bucket the line belongs
+    to (a section key or ``"remainder"``) and the text stored in that bucket.
+    """
+    normalized = line.replace("：", ":").replace("-", "-")
+    lower_line = normalized.lower()
+    for key, keywords in SECTION_HEADERS.items():
+        if any(keyword.lower() in lower_line for keyword in keywords):
+            cleaned = re.split(r"[:：]\s*", line, maxsplit=1)
+            if len(cleaned) == 2:
+                return key, key, cleaned[1].strip()
+            return key, key, line
+    if current_key:
+        return current_key, current_key, line
+    if input_mode == "bullet" and BULLET_PATTERN.match(line):
+        return current_key, "digest", BULLET_PATTERN.sub("", line)
+    return current_key, "remainder", line
+
+
+@dataclass
+class ParsedActionItem:
+    assignee: str
+    task: str
+    due_date: Optional[dt.date]
+
+
+def parse_action_items(text: str, meeting_date: dt.date) -> List[ParsedActionItem]:
+    """Parse lines such as ``田中 -> テスト計画更新（10/25まで）``.
+
+    Lines need an assignee (``->``/``→``) or a due date to be tracked.  A date
+    is taken as the due date when it is in brackets, marked with ``まで`` or
+    ``期限``, or ends the line.  Dates without a year are resolved to the
+    first occurrence on or after the meeting date.
+    """
+    items: List[ParsedActionItem] = []
+    for raw_line in text.splitlines():
+        line = ACTION_BULLET_PATTERN.sub("", raw_line.strip()).strip()
+        if not line:
+            continue
+        due_date = None
+        for pattern in DUE_DATE_PATTERNS:
+            match = pattern.search(line)
+            due_date = _resolve_due_date(match, meeting_date) if match else None
+            if due_date:
+                line = (line[: match.start()] + line[match.end() :]).strip()
+                break
+
+        parts = ASSIGNEE_SEPARATOR.split(line, maxsplit=1)
+        assignee, task = (parts[0].strip(), parts[1].strip()) if len(parts) == 2 else ("", line)
+        if not task or not (assignee or due_date):
+            continue
+        items.append(ParsedActionItem(assignee=assignee, task=task, due_date=due_date))
+    return items
+
+
+def _resolve_due_date(match: re.Match, meeting_date: dt.date) -> Optional[dt.date]:
+    groups = match.groupdict()
+    year = groups["iso_year"] or groups["jp_year"]
+    month = groups["iso_month"] or groups["jp_month"] or groups["month"]
+    day = groups["iso_day"] or groups["jp_day"] or groups["day"]
+    try:
+        if year:
+            return dt.date(int(year), int(month), int(day))
+        due_date = dt.date(meeting_date.year, int(month), int(day))
+        if due_date < meeting_date:
+            due_date = due_date.replace(year=meeting_date.year + 1)
+        return due_date
+    except ValueError:
+        return None
+
+
 def parse_text(request: SummaryRequest) -> ParsedSections:
     lines = [line.strip() for line in request.text.splitlines() if line.strip()]
-    sections: Dict[str, List[str]] = {k: [] for k in ["purpose", "decisions", "action_items", "digest"]}
-    remainder: List[str] = []
+    buckets: Dict[str, List[str]] = {k: [] for k in [*SECTION_KEYS, "remainder"]}
 
     current_key = None
     for line in lines:
-        normalized = line.replace("：", ":").replace("-", "-")
-        lower_line = normalized.lower()
-        matched = False
-        for key, keywords in SECTION_HEADERS.items():
-            if any(keyword.lower() in lower_line for keyword in keywords):
-                current_key = key
-                cleaned = re.split(r"[:：]\s*", line, maxsplit=1)
-                if len(cleaned) == 2:
-                    sections[key].append(cleaned[1].strip())
-                else:
-                    sections[key].append(line)
-                matched = True
-                break
-        if matched:
-            continue
-        if current_key:
-            sections[current_key].append(line)
-        elif request.input_mode == "bullet" and BULLET_PATTERN.match(line):
-            sections["digest"].append(BULLET_PATTERN.sub("", line))
-        else:
-            remainder.append(line)
+        current_key, bucket, content = classify_line(line, current_key, request.input_mode)
+        buckets[bucket].append(content)
 
     return ParsedSections(
-        purpose=sections["purpose"],
-        decisions=sections["decisions"],
-        action_items=sections["action_items"],
-        digest=sections["digest"],
-        remainder=remainder,
+        purpose=buckets["purpose"],
+        decisions=buckets["decisions"],
+        action_items=buckets["action_items"],
+        digest=buckets["digest"],
+        remainder=buckets["remainder"],
     )
 
 
@@ -81,9 +158,11 @@ def fallback_digest(parsed: ParsedSections) -> List[str]:
 
 
 def summarize(request: SummaryRequest) -> SummaryResponse:
-    parsed = parse_text(request)
+    return build_summary(request.title, parse_text(request))
+
 
-    purpose = _join_lines(parsed.purpose) or infer_purpose(request, parsed)
+def build_summary(title: str, parsed: ParsedSections) -> SummaryResponse:
+    purpose = _join_lines(parsed.purpose) or infer_purpose(title, parsed)
     decisions = _join_lines(parsed.decisions) or infer_decisions(parsed)
     action_items = _join_lines(parsed.action_items) or infer_actions(parsed)
     digest_lines = fallback_digest(parsed)
@@ -99,10 +178,10 @@ def summarize(request: SummaryRequest) -> SummaryResponse:
     return SummaryResponse(total_characters=total_chars, **summary_text)
 
 
-def infer_purpose(request: SummaryRequest, parsed: ParsedSections) -> str:
+def infer_purpose(title: str, parsed: ParsedSections) -> str:
     if parsed.remainder:
         return parsed.remainder[0]
-    return f"{request.title}に関する会議の目的を確認" if request.title else "会議の目的を要約"
+    return f"{title}に関する会議の目的を確認" if title else "会議の目的を要約"
 
 
 def infer_decisions(parsed: ParsedSections) -> str:
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from ..schemas import SummaryCacheStats, SummaryRequest, SummaryResponse
+from .summary import summarize
+
+# 要約ロジックを変更したら上げる（永続キャッシュの古い結果を無効化するため）
+CACHE_VERSION = 1
+MEMORY_CACHE_SIZE = 1024
+PERSISTENT_CACHE_PATH = os.environ.get("SUMMARY_CACHE_PATH")
+PERSISTENT_CACHE_MAX_BYTES = int(os.environ.get("SUMMARY_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+
+def cache_key(request: SummaryRequest) -> str:
+    """Hash the parts of the request ``summarize`` depends on.
+
+    Lines are stripped and blank lines dropped, as ``parse_text`` does, so
+    whitespace-only edits hit the same entry.  Date and participants do not
+    affect the summary and are left out.
+    """
+    lines = [line.strip() for line in request.text.splitlines() if line.strip()]
+    payload = json.dumps([CACHE_VERSION, request.input_mode, request.title, lines], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PersistentSummaryStore:
+    """SQLite-backed second tier, evicting least recently used rows past ``max_bytes``."""
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS summary_cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS ix_summary_cache_accessed_at ON summary_cache (accessed_at)")
+        self.connection.commit()
+        self.total_bytes = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM summary_cache").fetchone()[0]
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self.lock:
+            row = self.connection.execute("SELECT value FROM summary_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self.connection.execute("UPDATE summary_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self.connection.commit()
+            return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+        with self.lock:
+            previous = self.connection.execute("SELECT size FROM summary_cache WHERE key = ?", (key,)).fetchone()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO summary_cache (key, value, size, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time()),
+            )
+            self.total_bytes += size - (previous[0] if previous else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self.connection.commit()
+
+    def _evict(self) -> None:
+        victims = []
+        for key, size in self.connection.execute("SELECT key, size FROM summary_cache ORDER BY accessed_at"):
+            if self.total_bytes <= self.max_bytes:
+                break
+            victims.append((key,))
+            self.total_bytes -= size
+        self.connection.executemany("DELETE FROM summary_cache WHERE key = ?", victims)
+
+
+class SummaryCache:
+    """Memoizes ``summarize`` with an in-process LRU and an optional SQLite tier."""
+
+    def __init__(self, maxsize: int = MEMORY_CACHE_SIZE, store: Optional[PersistentSummaryStore] = None) -> None:
+        self.maxsize = maxsize
+        self.store = store
+        self.entries: OrderedDict[str, SummaryResponse] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    def summarize(self, request: SummaryRequest) -> SummaryResponse:
+        key = cache_key(request)
+        with self.lock:
+            cached = self.entries.get(key)
+            if cached is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        stored = self.store.get(key) if self.store else None
+        if stored is not None:
+            summary = SummaryResponse.parse_raw(stored)
+            with self.lock:
+                self.persistent_hits += 1
+        else:
+            summary = summarize(request)
+            if self.store:
+                self.store.put(key, summary.json())
+            with self.lock:
+                self.misses += 1
+
+        with self.lock:
+            self.entries[key] = summary
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return summary
+
+    def stats(self) -> SummaryCacheStats:
+        with self.lock:
+            return SummaryCacheStats(
+                hits=self.hits,
+                persistent_hits=self.persistent_hits,
+                misses=self.misses,
+                entries=len(self.entries),
+                persistent_bytes=self.store.total_bytes if self.store else None,
+            )
+
+
+summary_cache = SummaryCache(
+    store=PersistentSummaryStore(PERSISTENT_CACHE_PATH, PERSISTENT_CACHE_MAX_BYTES) if PERSISTENT_CACHE_PATH else None
+)
@@ -0,0 +1,28 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# app.database reads the path at import time, so point it at a scratch file first
+os.environ["MINUTES_DB_PATH"] = str(Path(tempfile.mkdtemp(prefix="minutes-test-")) / "minutes.db")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app import models  # noqa: E402
+from app.database import engine, init_db  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_db():
+    models.Base.metadata.drop_all(bind=engine)
+    models.archive_metadata.drop_all(bind=engine)
+    init_db()
+    yield
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,108 @@
+import datetime as dt
+
+from app.database import session_scope
+from app.services import analytics, archive
+from app.services.summary import parse_action_items
+
+MEETING_DATE = dt.date(2026, 10, 1)
+
+
+def minutes_payload(action_items):
+    return {
+        "title": "開発定例",
+        "meeting_date": MEETING_DATE.isoformat(),
+        "participants": ["田中"],
+        "raw_input": action_items,
+        "purpose": "",
+        "decisions": "",
+        "action_items": action_items,
+        "digest": "",
+    }
+
+
+def open_items(client, assignee):
+    summary = client.get("/api/analytics/open-action-items").json()
+    return next((row["open_action_items"] for row in summary if row["assignee"] == assignee), 0)
+
+
+def test_duplicate_lines_match_one_to_one(client):
+    text = "田中 -> 確認\n田中 -> 確認"
+    minutes_id = client.post("/api/minutes", json=minutes_payload(text)).json()["id"]
+    items = client.get("/api/action-items", params={"assignee": "田中"}).json()
+    assert len(items) == 2
+
+    for _ in range(3):
+        response = client.put(f"/api/minutes/{minutes_id}", json=minutes_payload(text))
+        assert response.status_code == 200
+    after = client.get("/api/action-items", params={"assignee": "田中"}).json()
+    assert sorted(item["id"] for item in after) == sorted(item["id"] for item in items)
+    assert open_items(client, "田中") == 2
+
+    client.put(f"/api/minutes/{minutes_id}", json=minutes_payload("田中 -> 確認"))
+    assert len(client.get("/api/action-items", params={"assignee": "田中"}).json()) == 1
+    assert open_items(client, "田中") == 1
+
+
+def parse_one(line):
+    items = parse_action_items(line, MEETING_DATE)
+    assert len(items) == 1
+    return items[0]
+
+
+def test_list_markers_are_stripped():
+    assert parse_one("- 田中 -> 確認").assignee == "田中"
+    assert parse_one("・佐藤 -> 確認").assignee == "佐藤"
+    assert parse_one("2. 鈴木 -> 確認").assignee == "鈴木"
+    assert parse_one("3) 高橋 -> 確認").assignee == "高橋"
+
+
+def test_leading_digits_are_kept():
+    item = parse_one("3班 -> 資料作成")
+    assert (item.assignee, item.task, item.due_date) == ("3班", "資料作成", None)
+
+    item = parse_one("10/25までに 田中 -> 見積提出")
+    assert (item.assignee, item.task, item.due_date) == ("田中", "見積提出", dt.date(2026, 10, 25))
+
+
+def test_date_inside_task_is_not_a_due_date():
+    item = parse_one("佐藤 -> 1/2 の資料を確認")
+    assert (item.assignee, item.task, item.due_date) == ("佐藤", "1/2 の資料を確認", None)
+
+
+def test_due_date_forms():
+    cases = {
+        "田中 -> 見積提出（10/25まで）": dt.date(2026, 10, 25),
+        "田中 -> 見積提出 (期限: 2027-01-15)": dt.date(2027, 1, 15),
+        "田中 -> 期限 11月1日 見積提出": dt.date(2026, 11, 1),
+        "田中 -> 10/25 までに見積提出": dt.date(2026, 10, 25),
+        "田中 -> 見積提出 10/25": dt.date(2026, 10, 25),
+    }
+    for line, due_date in cases.items():
+        item = parse_one(line)
+        assert (item.assignee, item.task, item.due_date) == ("田中", "見積提出", due_date), line
+
+
+def test_year_less_date_rolls_over_to_next_year():
+    assert parse_one("田中 -> 見積提出（9/30まで）").due_date == dt.date(2027, 9, 30)
+
+
+def test_lines_without_assignee_or_due_date_are_skipped():
+    assert parse_action_items("全体の進捗は順調\n1/2 の資料を確認", MEETING_DATE) == []
+
+
+def test_archived_action_items_leave_open_counts(client):
+    minutes_id = client.post("/api/minutes", json=minutes_payload("田中 -> 確認\n田中 -> 資料作成")).json()["id"]
+    items = client.get("/api/action-items", params={"assignee": "田中"}).json()
+    client.put(f"/api/action-items/{items[1]['id']}", json={"status": "done"})
+    assert open_items(client, "田中") == 1
+
+    with session_scope() as session:
+        assert archive.archive_minutes(session, older_than_days=0, today=MEETING_DATE + dt.timedelta(days=1)) == 1
+    assert client.get("/api/minutes").json()[0]["id"] == minutes_id
+    assert client.get("/api/action-items", params={"assignee": "田中"}).json() == []
+    assert client.put(f"/api/action-items/{items[0]['id']}", json={"status": "done"}).status_code == 404
+    assert open_items(client, "田中") == 0
+
+    with session_scope() as session:
+        analytics.rebuild(session)
+    assert open_items(client, "田中") == 0
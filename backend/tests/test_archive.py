@@ -0,0 +1,78 @@
+import datetime as dt
+import io
+
+from app import models
+from app.database import engine, init_db, session_scope
+from app.services import archive, snapshot
+
+
+def create_minutes(client, meeting_date, title="定例会議"):
+    response = client.post(
+        "/api/minutes",
+        json={
+            "title": title,
+            "meeting_date": meeting_date,
+            "participants": ["田中", "佐藤"],
+            "raw_input": "目的: 進捗確認",
+            "purpose": "進捗確認",
+            "decisions": "QA を完了",
+            "action_items": "田中 -> テスト計画更新",
+            "digest": "順調",
+        },
+    )
+    assert response.status_code == 200
+    minutes_id = response.json()["id"]
+    reminder = client.post(
+        f"/api/minutes/{minutes_id}/reminders",
+        json={"assignee": "田中", "action_item": "テスト計画更新", "due_date": meeting_date},
+    )
+    assert reminder.status_code == 200
+    return minutes_id
+
+
+def run_archive():
+    with session_scope() as session:
+        return archive.archive_minutes(session, older_than_days=365, today=dt.date(2025, 1, 1))
+
+
+def test_archive_twice(client):
+    first = create_minutes(client, "2020-04-01", title="2020 年度キックオフ")
+    assert run_archive() == 1
+
+    second = create_minutes(client, "2021-04-01", title="2021 年度キックオフ")
+    assert run_archive() == 1
+
+    listed = {item["id"] for item in client.get("/api/minutes").json()}
+    assert listed == {first, second}
+    for minutes_id, title in ((first, "2020 年度キックオフ"), (second, "2021 年度キックオフ")):
+        detail = client.get(f"/api/minutes/{minutes_id}").json()
+        assert detail["title"] == title
+        assert len(detail["versions"]) == 1
+        assert len(detail["reminders"]) == 1
+        assert len(client.get(f"/api/minutes/{minutes_id}/history").json()) == 1
+
+
+def test_restore_after_archive(client):
+    archived = create_minutes(client, "2020-04-01")
+    assert run_archive() == 1
+    hot = create_minutes(client, "2024-10-01")
+    hot_detail = client.get(f"/api/minutes/{hot}").json()
+    hot_items = client.get("/api/action-items").json()
+
+    dump = b"".join(snapshot.stream_snapshot())
+    models.Base.metadata.drop_all(bind=engine)
+    models.archive_metadata.drop_all(bind=engine)
+    init_db()
+
+    restored = snapshot.restore_snapshot(io.BufferedReader(io.BytesIO(dump)))
+    assert restored == 8  # two meetings, each with one version, reminder and action item
+    for minutes_id in (archived, hot):
+        detail = client.get(f"/api/minutes/{minutes_id}").json()
+        assert len(detail["versions"]) == 1
+        assert len(detail["reminders"]) == 1
+    # hot child rows keep their ids; only archived ones are renumbered
+    assert client.get(f"/api/minutes/{hot}").json() == hot_detail
+    restored_items = {item["id"]: item for item in client.get("/api/action-items").json()}
+    assert hot_items
+    for item in hot_items:
+        assert restored_items[item["id"]] == item
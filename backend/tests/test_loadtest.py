@@ -0,0 +1,16 @@
+import asyncio
+
+import pytest
+
+from app import loadtest
+
+
+def test_remote_run_requires_allow_writes():
+    with pytest.raises(ValueError, match="allow-writes"):
+        asyncio.run(loadtest.run(base_url="http://localhost:8000", duration=0))
+
+
+def test_parse_mix():
+    assert loadtest.parse_mix("generate=3,list") == {"generate": 3, "list": 1}
+    with pytest.raises(ValueError):
+        loadtest.parse_mix("unknown=1")
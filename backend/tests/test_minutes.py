@@ -0,0 +1,58 @@
+import datetime as dt
+import threading
+import time
+
+from app.database import session_scope
+from app.schemas import MinutesCreateRequest
+from app.services import archive
+from app.services import minutes as minutes_service
+
+
+def payload(meeting_date):
+    return MinutesCreateRequest(
+        title="定例会議",
+        meeting_date=meeting_date,
+        participants=["田中"],
+        raw_input="目的: 進捗確認",
+        purpose="進捗確認",
+        decisions="",
+        action_items="",
+        digest="",
+    )
+
+
+def test_concurrent_creates_after_archive_get_distinct_ids(monkeypatch):
+    with session_scope() as session:
+        minutes_service.create_minutes(session, payload(dt.date(2020, 4, 1)))
+    with session_scope() as session:
+        assert archive.archive_minutes(session, older_than_days=365, today=dt.date(2025, 1, 1)) == 1
+
+    # the first create holds its id for a while before inserting
+    reserved = threading.Event()
+    next_minutes_id = archive.next_minutes_id
+
+    def slow_next_minutes_id(session):
+        value = next_minutes_id(session)
+        if not reserved.is_set():
+            reserved.set()
+            time.sleep(0.3)
+        return value
+
+    monkeypatch.setattr(archive, "next_minutes_id", slow_next_minutes_id)
+    ids, errors = [], []
+
+    def create():
+        try:
+            with session_scope() as session:
+                ids.append(minutes_service.create_minutes(session, payload(dt.date(2024, 10, 1))).id)
+        except Exception as exc:  # collected so the assertion shows it
+            errors.append(exc)
+
+    first = threading.Thread(target=create)
+    first.start()
+    reserved.wait()
+    create()
+    first.join()
+
+    assert errors == []
+    assert sorted(ids) == [2, 3]
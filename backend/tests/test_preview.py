@@ -0,0 +1,67 @@
+import datetime as dt
+import json
+import random
+
+from app.schemas import SummaryRequest
+from app.services.preview import PreviewSession
+from app.services.summary import summarize
+
+# headers switch the section in effect, so edits near them exercise the reparse of the tail
+LINE_POOL = [
+    "",
+    "目的: リリース準備の進捗確認",
+    "決定事項: QA を 10/25 までに完了",
+    "宿題:",
+    "田中 -> テスト計画更新",
+    "- 監視設定の見直し",
+    "* 顧客向け告知文の確認",
+    "1. 次回は来週水曜日",
+    "議事要旨: 全体の進捗は順調",
+    "まとめ",
+    "リリース日は据え置き",
+    "   ",
+]
+
+
+def full_summary(session):
+    request = SummaryRequest(
+        title=session.title,
+        meeting_date=dt.date(2026, 10, 1),
+        text="\n".join(session.lines),
+        input_mode=session.input_mode,
+    )
+    return summarize(request)
+
+
+def random_lines(rng, count):
+    return [rng.choice(LINE_POOL) for _ in range(count)]
+
+
+def test_edit_sequences_match_full_summarize():
+    rng = random.Random(20251019)
+    for _ in range(300):
+        session = PreviewSession()
+        mode = rng.choice(["free", "bullet"])
+        session.apply({"type": "init", "title": "開発定例", "input_mode": mode, "text": "\n".join(random_lines(rng, 6))})
+        assert session.summary() == full_summary(session)
+        for _ in range(15):
+            start = rng.randint(0, len(session.lines))
+            end = rng.randint(start, min(len(session.lines), start + 3))
+            summary = session.apply({"type": "edit", "start": start, "end": end, "lines": random_lines(rng, rng.randint(0, 3))})
+            assert summary == full_summary(session)
+
+
+def test_settings_change_mode_without_resending_text():
+    session = PreviewSession()
+    session.apply({"type": "init", "title": "開発定例", "input_mode": "free", "text": "- 監視設定の見直し\n- 告知文の確認"})
+    summary = session.apply({"type": "settings", "title": "リリース定例", "input_mode": "bullet"})
+    assert (session.title, session.input_mode) == ("リリース定例", "bullet")
+    assert summary == full_summary(session)
+
+
+def test_preview_frames_are_utf8(client):
+    with client.websocket_connect("/api/minutes/preview") as websocket:
+        websocket.send_text(json.dumps({"type": "init", "title": "開発定例", "text": "目的: リリース準備"}))
+        frame = websocket.receive_text()
+    assert "\\u" not in frame
+    assert json.loads(frame)["purpose"] == "リリース準備"
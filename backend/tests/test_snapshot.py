@@ -0,0 +1,32 @@
+from app.services import snapshot
+
+
+def create_minutes(client, meeting_date):
+    response = client.post(
+        "/api/minutes",
+        json={
+            "title": "定例会議",
+            "meeting_date": meeting_date,
+            "participants": ["田中"],
+            "raw_input": "目的: 進捗確認",
+            "purpose": "進捗確認",
+            "decisions": "",
+            "action_items": "田中 -> テスト計画更新",
+            "digest": "",
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def test_writes_proceed_while_snapshot_streams(client):
+    before = create_minutes(client, "2024-10-01")
+    with snapshot.read_snapshot_connection() as connection:
+        chunks = snapshot.iter_ndjson(connection)
+        next(chunks)  # header
+        next(chunks)  # first batch of minutes rows; the read transaction is now open
+        during = create_minutes(client, "2024-10-02")
+        rest = b"".join(chunks).decode("utf-8")
+    # the snapshot keeps the state from when it started
+    assert f'"minutes_id": {before}' in rest
+    assert f'"minutes_id": {during}' not in rest
@@ -1,6 +1,9 @@
 const API_BASE = window.location.origin.includes("localhost")
   ? "http://localhost:8000/api"
   : "/api";
+const WS_BASE = API_BASE.startsWith("http")
+  ? API_BASE.replace(/^http/, "ws")
+  : `${window.location.protocol === "https:" ? "wss" : "ws"}://${window.location.host}${API_BASE}`;
 
 const $ = (selector) => document.querySelector(selector);
 const $$ = (selector) => document.querySelectorAll(selector);
@@ -236,6 +239,108 @@ const generateButton = $("#generate-summary");
 const summaryEditor = $("#summary-editor");
 const summaryLength = $("#summary-length");
 
+const formText = $("#form-text");
+const summaryFields = ["#summary-purpose", "#summary-decisions", "#summary-actions", "#summary-digest"];
+let summaryEdited = false;
+let previewSocket = null;
+let previewLines = [];
+
+function renderSummary(summary) {
+  $("#summary-purpose").value = summary.purpose;
+  $("#summary-decisions").value = summary.decisions;
+  $("#summary-actions").value = summary.action_items;
+  $("#summary-digest").value = summary.digest;
+  summaryLength.textContent = `総文字数: ${summary.total_characters} / 1000`;
+  summaryEditor.classList.remove("hidden");
+}
+
+// 手動で編集した要約はライブプレビューで上書きしない
+summaryFields.forEach((selector) => {
+  $(selector).addEventListener("input", () => {
+    summaryEdited = true;
+  });
+});
+
+function openPreview() {
+  const socket = new WebSocket(`${WS_BASE}/minutes/preview`);
+  socket.addEventListener("open", sendPreviewInit);
+  socket.addEventListener("message", (event) => {
+    const data = JSON.parse(event.data);
+    if (data.error || summaryEdited || !formText.value.trim()) return;
+    renderSummary(data);
+  });
+  socket.addEventListener("close", () => {
+    if (previewSocket === socket) previewSocket = null;
+  });
+  previewSocket = socket;
+}
+
+function sendPreviewInit() {
+  if (!previewSocket || previewSocket.readyState !== WebSocket.OPEN) return;
+  previewLines = formText.value.split("\n");
+  previewSocket.send(
+    JSON.stringify({
+      type: "init",
+      title: $("#form-title").value.trim(),
+      input_mode: $("#form-mode").value,
+      text: formText.value,
+    }),
+  );
+}
+
+// タイトル・モードの変更では本文を送り直さない
+function sendPreviewSettings() {
+  if (!previewSocket || previewSocket.readyState !== WebSocket.OPEN) return;
+  previewSocket.send(
+    JSON.stringify({
+      type: "settings",
+      title: $("#form-title").value.trim(),
+      input_mode: $("#form-mode").value,
+    }),
+  );
+}
+
+// 変更された行の範囲だけを送信する（前後の一致行は省略）
+function sendPreviewEdit() {
+  if (!previewSocket) {
+    openPreview();
+    return;
+  }
+  if (previewSocket.readyState !== WebSocket.OPEN) return;
+  const lines = formText.value.split("\n");
+  let start = 0;
+  while (start < lines.length && start < previewLines.length && lines[start] === previewLines[start]) {
+    start += 1;
+  }
+  let suffix = 0;
+  while (
+    suffix < lines.length - start &&
+    suffix < previewLines.length - start &&
+    lines[lines.length - 1 - suffix] === previewLines[previewLines.length - 1 - suffix]
+  ) {
+    suffix += 1;
+  }
+  if (start === lines.length && start === previewLines.length) return;
+  previewSocket.send(
+    JSON.stringify({
+      type: "edit",
+      start,
+      end: previewLines.length - suffix,
+      lines: lines.slice(start, lines.length - suffix),
+    }),
+  );
+  previewLines = lines;
+}
+
+formText.addEventListener("input", sendPreviewEdit);
+$("#form-title").addEventListener("input", sendPreviewSettings);
+$("#form-mode").addEventListener("change", sendPreviewSettings);
+$("#minutes-form").addEventListener("reset", () => {
+  summaryEdited = false;
+  previewLines = [];
+  setTimeout(sendPreviewInit);
+});
+
 generateButton.addEventListener("click", async () => {
   const title = $("#form-title").value.trim();
   const meetingDate = $("#form-date").value;
@@ -257,12 +362,8 @@ generateButton.addEventListener("click", async () => {
       method: "POST",
       body: JSON.stringify(payload),
     });
-    $("#summary-purpose").value = summary.purpose;
-    $("#summary-decisions").value = summary.decisions;
-    $("#summary-actions").value = summary.action_items;
-    $("#summary-digest").value = summary.digest;
-    summaryLength.textContent = `総文字数: ${summary.total_characters} / 1000`;
-    summaryEditor.classList.remove("hidden");
+    summaryEdited = false;
+    renderSummary(summary);
   } catch (error) {
     showMessage(`要約生成に失敗しました: ${error.message}`);
   }